@@ -1,6 +1,7 @@
 __all__ = [
     "azel",
     "compute",
+    "compute_many",
     "consts",
     "get_location",
     "get_object",
@@ -13,17 +14,49 @@ __all__ = [
 __version__ = "0.7.0"
 
 
-# submodules
-from . import azel
-from . import consts
-from . import location
-from . import object
-from . import time
-from . import utils
+# standard library
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING as _TYPE_CHECKING, Any as _Any
 
 
-# aliases
-from .azel import compute
-from .location import get_location
-from .object import get_object
-from .time import get_time
+# submodules and aliases (imported on first access)
+_SUBMODULES = ("azel", "consts", "location", "object", "time", "utils")
+_ALIASES = {
+    "compute": "azel",
+    "compute_many": "azel",
+    "get_location": "location",
+    "get_object": "object",
+    "get_time": "time",
+}
+
+
+def __getattr__(name: str) -> _Any:
+    """Import a submodule or an alias when it is first accessed."""
+    if name in _SUBMODULES:
+        value = _import_module(f".{name}", __name__)
+    elif name in _ALIASES:
+        value = getattr(_import_module(f".{_ALIASES[name]}", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the public names of the module including lazy ones."""
+    dunders = (name for name in globals() if name.startswith("__"))
+    return sorted({*dunders, *__all__})
+
+
+if _TYPE_CHECKING:
+    from . import azel
+    from . import consts
+    from . import location
+    from . import object
+    from . import time
+    from . import utils
+    from .azel import compute, compute_many
+    from .location import get_location
+    from .object import get_object
+    from .time import get_time
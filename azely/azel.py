@@ -1,8 +1,21 @@
-__all__ = ["AzEl", "compute"]
+__all__ = ["AzEl", "compute", "compute_many"]
+
+
+# standard library
+from typing import Sequence
 
 
 # dependent packages
-from pandas import DataFrame, DatetimeIndex, Timestamp, to_timedelta
+from astropy.coordinates import AltAz, Latitude, Longitude, SkyCoord
+from astropy.coordinates.erfa_astrom import (
+    ErfaAstrom,
+    ErfaAstromInterpolator,
+    erfa_astrom,
+)
+from astropy.time import Time as ObsTime
+from astropy.units import Quantity
+from numpy import diff, median
+from pandas import DataFrame, DatetimeIndex
 from .location import Location, get_location
 from .object import Object, get_object
 from .time import Time, get_time
@@ -13,6 +26,7 @@ from .consts import (
     DAYFIRST,
     FRAME,
     FREQ,
+    INTERP,
     SITE,
     TIME,
     TIMEOUT,
@@ -20,6 +34,9 @@ from .consts import (
     YEARFIRST,
 )
 
+NS_PER_DAY = 86_400_000_000_000
+NS_PER_HOUR = 3_600_000_000_000
+NS_PER_SECOND = 1_000_000_000
 SOLAR_TO_SIDEREAL = 1.002_737_909
 
 
@@ -38,18 +55,19 @@ class AzEl(DataFrame):
     @property
     def in_lst(self):
         """Convert time index to LST."""
-        td = self.index - self.index[0]
-        td_lst = td * SOLAR_TO_SIDEREAL + self.lst[0]
-        td_lst = td_lst.floor("1D") + self.lst
+        # computed on int64 nanoseconds to avoid intermediate indexes
+        t = self.index.values.astype("M8[ns]").view("i8")
+        lst = self.lst.to_numpy("m8[ns]").view("i8")
 
-        lst = Timestamp(0) + td_lst
-        return self.set_index(DatetimeIndex(lst, name="LST"))
+        td_lst = ((t - t[0]) * SOLAR_TO_SIDEREAL).astype("i8") + lst[0]
+        td_lst = td_lst // NS_PER_DAY * NS_PER_DAY + lst
+
+        return self.set_index(DatetimeIndex(td_lst.view("M8[ns]"), name="LST"))
 
     @property
     def in_utc(self):
         """Convert time index to UTC."""
-        utc = self.index.tz_convert("UTC")
-        return self.set_index(DatetimeIndex(utc, name="UTC"))
+        return self.set_index(self.index.tz_convert("UTC").rename("UTC"))
 
     @property
     def _constructor(self):
@@ -68,6 +86,7 @@ def compute(
     dayfirst: bool = DAYFIRST,
     yearfirst: bool = YEARFIRST,
     timeout: int = TIMEOUT,
+    interp: float = INTERP,
 ) -> AzEl:
     """Compute az/el and local sidereal time (LST) of an astronomical object.
 
@@ -105,6 +124,13 @@ def compute(
             ``'01-02-03'`` is treated as Feb. 3rd 2001. If ``dayfirst`` is also ``True``,
             then it will be Mar. 2nd 2001.
         timeout: (common option) Query timeout expressed in units of seconds.
+        interp: (common option) Time interval in units of seconds at which
+            astrometry parameters (e.g., precession and nutation) are computed
+            and interpolated for the az/el transform. It is only used if the time
+            samples are denser than it (e.g., ``freq='1T'`` for the default 300 s),
+            which speeds up the transform by a few times at the cost of tiny
+            errors (up to tens of mas for the Moon). Otherwise, or if it is zero,
+            the parameters are computed exactly at every time sample.
 
     Returns:
         Computed DataFrame of object's az/el and LST at given site and view.
@@ -130,11 +156,76 @@ def compute(
     site_ = get_location(site, timeout=timeout)
     time_ = get_time(time, view or site, freq, dayfirst, yearfirst, timeout)
 
-    return _compute(object_, site_, time_)
+    return _compute(object_, site_, time_, interp)
+
+
+def compute_many(
+    objects: Sequence[str],
+    site: str = SITE,
+    time: str = TIME,
+    view: str = VIEW,
+    frame: str = FRAME,
+    freq: str = FREQ,
+    dayfirst: bool = DAYFIRST,
+    yearfirst: bool = YEARFIRST,
+    timeout: int = TIMEOUT,
+    interp: float = INTERP,
+) -> dict[str, AzEl]:
+    """Compute az/el and local sidereal time (LST) of astronomical objects.
+
+    Similar to ``compute`` function, but this function receives multiple
+    query strings for objects and computes them at the same site and time.
+    Objects in the same equatorial coordinates are transformed to az/el
+    at once, which is much faster than calling ``compute`` for each object.
+
+    Args:
+        objects: Query strings for object information (e.g., ``['Sun', 'NGC1068']``).
+        site: Query string for location information at a site (e.g., ``'Tokyo'``).
+        time: Query string for time information at a view (e.g., ``'2020-01-01'``).
+        view: Query string for timezone information at the view. (e.g., ``'Asia/Tokyo'``,
+            ``'UTC'``, or ``Tokyo``). By default (``''``),  timezone at the site is used.
+        frame: (object option) Name of equatorial coordinates used in astropy's SkyCoord.
+        freq: (time option) Frequency of time samples as the same format of pandas offset
+            aliases (e.g., ``'1D'`` -> 1 day, ``'3H'`` -> 3 hours, ``'10T'`` -> 10 minutes).
+        dayfirst: (time option) Whether to interpret the first value in an ambiguous
+            3-integer date (e.g., ``'01-02-03'``) as the day.
+        yearfirst: (time option) Whether to interpret the first value in an ambiguous
+            3-integer date (e.g., ``'01-02-03'``) as the year.
+        timeout: (common option) Query timeout expressed in units of seconds.
+        interp: (common option) Time interval in units of seconds at which
+            astrometry parameters (e.g., precession and nutation) are computed
+            and interpolated for the az/el transform. It is only used if the time
+            samples are denser than it (e.g., ``freq='1T'`` for the default 300 s),
+            which speeds up the transform by a few times at the cost of tiny
+            errors (up to tens of mas for the Moon). Otherwise, or if it is zero,
+            the parameters are computed exactly at every time sample.
+
+    Returns:
+        Dictionary of computed DataFrames keyed by the query strings of objects.
+
+    Raises:
+        AzelyError: Raised if one of mid-level APIs fails to get any information.
+
+    Examples:
+        To compute daily az/el of the Sun and NGC1068 at ALMA AOS::
+
+            >>> dfs = azely.compute_many(['Sun', 'NGC1068'], 'ALMA AOS', '2020-02-01')
+
+    """  # noqa: E501
+    objects_ = [get_object(obj, frame=frame, timeout=timeout) for obj in objects]
+    site_ = get_location(site, timeout=timeout)
+    time_ = get_time(time, view or site, freq, dayfirst, yearfirst, timeout)
+
+    return dict(zip(objects, _compute_many(objects_, site_, time_, interp)))
 
 
 # helper functions
-def _compute(object: Object, site: Location, time: Time) -> AzEl:
+def _compute(
+    object: Object,
+    site: Location,
+    time: Time,
+    interp: float = INTERP,
+) -> AzEl:
     """Compute az/el and local sidereal time (LST) of an astronomical object.
 
     Similar to ``compute`` function, but this function receives instances
@@ -144,6 +235,7 @@ def _compute(object: Object, site: Location, time: Time) -> AzEl:
         object: Object information.
         site: Site location information.
         time: Time information.
+        interp: Time interval in units of seconds for astrometry interpolation.
 
     Returns:
         Computed DataFrame of object's az/el and LST at given site and view.
@@ -152,14 +244,84 @@ def _compute(object: Object, site: Location, time: Time) -> AzEl:
         AzelyError: Raised if one of mid-level APIs fails to get any information.
 
     """
-    obstime = time.to_obstime(site.to_earthlocation())
-    skycoord = object.to_skycoord(obstime)
+    return _compute_many([object], site, time, interp)[0]
+
+
+def _compute_many(
+    objects: Sequence[Object],
+    site: Location,
+    time: Time,
+    interp: float = INTERP,
+) -> list[AzEl]:
+    """Compute az/el and local sidereal time (LST) of astronomical objects.
+
+    Similar to ``_compute`` function, but this function receives multiple
+    objects and transforms those in the same frame to az/el at once.
+
+    Args:
+        objects: Object information.
+        site: Site location information.
+        time: Time information.
+        interp: Time interval in units of seconds for astrometry interpolation.
+
+    Returns:
+        Computed DataFrames of objects' az/el and LST in the order of objects.
+
+    """
+    earthloc = site.to_earthlocation()
+    obstime = time.to_obstime(earthloc)
+    altaz = AltAz(obstime=obstime, location=earthloc)
+    index = time.to_index()
+    lst = obstime.sidereal_time("mean").value * NS_PER_HOUR
+    lst = lst.astype("i8").view("m8[ns]")
+
+    # interpolation only pays off if samples are denser than its support points
+    t = index.values.astype("M8[ns]").view("i8")
+
+    if len(t) > 1 and median(abs(diff(t))) < interp * NS_PER_SECOND:
+        astrom = ErfaAstromInterpolator(Quantity(interp, "s"))
+    else:
+        astrom = ErfaAstrom()
+
+    azels: dict[int, AzEl] = {}
+
+    for indices in _group(objects):
+        skycoord = _stack([objects[i] for i in indices], obstime)
+
+        with erfa_astrom.set(astrom):
+            observed = skycoord.transform_to(altaz)
+
+        azs = observed.az.to_value("deg")
+        els = observed.alt.to_value("deg")
+
+        for i, az, el in zip(indices, azs, els):
+            azel = AzEl(dict(az=az, el=el, lst=lst), index=index)
+            azel.object = objects[i]
+            azel.site = site
+            azels[i] = azel
+
+    return [azels[i] for i in range(len(objects))]
+
+
+def _group(objects: Sequence[Object]) -> list[list[int]]:
+    """Group indices of objects that can be transformed at once."""
+    groups: dict[str, list[int]] = {}
+
+    for i, object in enumerate(objects):
+        key = f"{object.frame}:{i}" if object.is_solar else object.frame
+        groups.setdefault(key, []).append(i)
+
+    return list(groups.values())
+
 
-    az = skycoord.altaz.az
-    el = skycoord.altaz.alt
-    lst = to_timedelta(obstime.sidereal_time("mean").value, unit="hr")
+def _stack(objects: Sequence[Object], obstime: ObsTime) -> SkyCoord:
+    """Stack objects in the same frame into a SkyCoord of (objects, times)."""
+    if objects[0].is_solar:
+        return objects[0].to_skycoord(obstime).reshape(1, -1)
 
-    azel = AzEl(dict(az=az, el=el, lst=lst), index=time.to_index())
-    azel.object = object
-    azel.site = site
-    return azel
+    return SkyCoord(
+        Longitude([object.longitude for object in objects])[:, None],
+        Latitude([object.latitude for object in objects])[:, None],
+        frame=objects[0].frame,
+        obstime=obstime,
+    )
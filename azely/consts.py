@@ -16,6 +16,7 @@ __all__ = [
     "FRAME",
     "FREQ",
     "GOOGLE_API",
+    "INTERP",
     "IPINFO_API",
     "SITE",
     "TIME",
@@ -33,7 +34,7 @@ from typing import Any, Optional, TypeVar, overload
 
 # dependencies
 from astropy.coordinates import solar_system_ephemeris as solar
-from tomlkit import load
+from .utils import read_toml
 
 
 # type hints
@@ -67,14 +68,13 @@ def getval(toml: Path, keys: str, default: Any) -> Any:
     else:
         type_, default_ = type(default), default
 
-    with open(toml) as file:
-        doc = load(file)
+    doc = read_toml(toml)
 
     for key in keys.split("."):
         if (doc := doc.get(key)) is None:
             return default_
 
-    return type_(doc.unwrap())
+    return type_(doc)
 
 
 # file-related
@@ -124,6 +124,9 @@ FREQ = getval(AZELY_CONFIG, "defaults.freq", "10T")
 GOOGLE_API = getval(AZELY_CONFIG, "defaults.google_api", str)
 """Default value for the ``google_api`` parameter."""
 
+INTERP = getval(AZELY_CONFIG, "defaults.interp", 300.0)
+"""Default value for the ``interp`` parameter."""
+
 IPINFO_API = getval(AZELY_CONFIG, "defaults.ipinfo_api", str)
 """Default value for the ``ipinfo_api`` parameter."""
 
@@ -4,21 +4,27 @@ __all__ = ["Location", "get_location"]
 # standard library
 from dataclasses import dataclass
 from datetime import tzinfo
-from functools import partial
-from typing import ClassVar, Optional
+from functools import lru_cache, partial
+from typing import Optional
 
 
 # dependencies
 from astropy.coordinates import EarthLocation, Latitude, Longitude
 from astropy.units import Quantity
 from astropy.utils.data import conf
-from ipinfo import getHandler
 from pytz import timezone
 from timezonefinder import TimezoneFinder
 from .consts import AZELY_CACHE, GOOGLE_API, HERE, IPINFO_API, TIMEOUT
 from .utils import PathLike, cache, rename
 
 
+class SharedTimezoneFinder:
+    """Descriptor that returns the TimezoneFinder instance created on first use."""
+
+    def __get__(self, obj: object, objtype: Optional[type] = None) -> TimezoneFinder:
+        return get_timezonefinder()
+
+
 @dataclass
 class Location:
     """Location information."""
@@ -35,7 +41,7 @@ class Location:
     altitude: str = "0.0 m"
     """Altitude of the location."""
 
-    tf: ClassVar = TimezoneFinder()
+    tf = SharedTimezoneFinder()
     """TimezoneFinder instance."""
 
     def __post_init__(self) -> None:
@@ -47,20 +53,11 @@ class Location:
     @property
     def timezone(self) -> tzinfo:
         """Timezone of the location."""
-        response = self.tf.timezone_at(
-            lng=Longitude(self.longitude).value,
-            lat=Latitude(self.latitude).value,
-        )
-
-        return timezone(str(response))
+        return get_timezone(self.longitude, self.latitude)
 
     def to_earthlocation(self) -> EarthLocation:
         """Convert it to an EarthLocation object."""
-        return EarthLocation(
-            lon=Longitude(self.longitude),
-            lat=Latitude(self.latitude),
-            height=Quantity(self.altitude),
-        )
+        return get_earthlocation(self.longitude, self.latitude, self.altitude)
 
 
 def get_location(
@@ -109,6 +106,9 @@ def get_location_by_ip(
     update: bool,  # @cache
 ) -> Location:
     """Get location information by ipinfo.io."""
+    # imported here as ipinfo (and aiohttp) is slow to import
+    from ipinfo import getHandler
+
     handler = getHandler(ipinfo_api)
     response = handler.getDetails(timeout=timeout)
 
@@ -145,3 +145,30 @@ def get_location_by_map(
         longitude=str(response.lon),
         latitude=str(response.lat),
     )
+
+
+@lru_cache(maxsize=None)
+def get_timezone(longitude: str, latitude: str) -> tzinfo:
+    """Get the timezone at a location (cached by its coordinates)."""
+    response = get_timezonefinder().timezone_at(
+        lng=Longitude(longitude).wrap_at("180d").value,  # type: ignore
+        lat=Latitude(latitude).value,
+    )
+
+    return timezone(str(response))
+
+
+@lru_cache(maxsize=None)
+def get_timezonefinder() -> TimezoneFinder:
+    """Get a TimezoneFinder instance (created on first use)."""
+    return TimezoneFinder()
+
+
+@lru_cache(maxsize=None)
+def get_earthlocation(longitude: str, latitude: str, altitude: str) -> EarthLocation:
+    """Get an EarthLocation object (cached by its coordinates)."""
+    return EarthLocation(
+        lon=Longitude(longitude),
+        lat=Latitude(latitude),
+        height=Quantity(altitude),
+    )
@@ -51,6 +51,7 @@ from typing import Callable
 from astropy.coordinates import EarthLocation
 from astropy.time import Time as ObsTime
 from dateutil.parser import parse
+from erfa import dtf2d
 from pandas import DatetimeIndex, date_range
 from pytz import UnknownTimeZoneError, timezone
 from .utils import AzelyError
@@ -68,6 +69,8 @@ from .consts import (
 )
 
 DELIMITER = "to"
+NS_PER_HOUR = 3_600_000_000_000
+NS_PER_MINUTE = 60_000_000_000
 
 
 # data classes
@@ -76,7 +79,21 @@ class Time(DatetimeIndex):
 
     def to_obstime(self, earthloc: EarthLocation) -> ObsTime:
         """Convert it to an astropy's time (obstime)."""
-        return ObsTime(self.tz_convert(None), location=earthloc)
+        # convert calendar fields to JD directly (astropy would parse strings)
+        dt = self.values.astype("M8[ns]")
+        year, month, day = (dt.astype(f"M8[{u}]") for u in "YMD")
+        ns = (dt - day).view("i8")
+
+        jd1, jd2 = dtf2d(
+            "UTC",
+            year.view("i8") + 1970,
+            month.view("i8") % 12 + 1,
+            (day - month).view("i8") + 1,
+            ns // NS_PER_HOUR,
+            ns // NS_PER_MINUTE % 60,
+            ns % NS_PER_MINUTE / 1e9,
+        )
+        return ObsTime(jd1, jd2, format="jd", scale="utc", location=earthloc)
 
     def to_index(self) -> DatetimeIndex:
         """Convert it to a pandas DatetimeIndex."""
@@ -7,18 +7,27 @@ from dataclasses import asdict, replace
 from functools import wraps
 from inspect import Signature
 from pathlib import Path
-from typing import Any, Callable, Iterator, Optional, TypeVar, Union
+from sys import version_info
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Mapping, Optional, TypeVar, Union
 
 
 # dependencies
 from tomlkit import TOMLDocument, dump, load, nl
 
+if version_info >= (3, 11):
+    from tomllib import load as fastload
+
 
 # type hints
 PathLike = Union[Path, str]
 TCallable = TypeVar("TCallable", bound=Callable[..., Any])
 
 
+# parsed TOML files keyed by path (only the latest parse is kept)
+TOML_DOCS: dict[Path, tuple[int, int, Mapping[str, Any]]] = {}
+
+
 class AzelyError(Exception):
     """Azely's base exception class."""
 
@@ -39,13 +48,14 @@ def cache(func: TCallable, table: str) -> TCallable:
         if (source := bargs["source"]) is None:
             return func(*args, **kwargs)
 
-        with sync_toml(source) as doc:
-            tab = doc.setdefault(table, {})
+        query = bargs["query"]
 
-            if (query := bargs["query"]) in tab:
-                if not bargs["update"]:
-                    return DataClass(**tab[query].unwrap())
+        if not bargs["update"]:
+            if query in (tab := read_toml(source).get(table, {})):
+                return DataClass(**tab[query])
 
+        with sync_toml(source) as doc:
+            tab = doc.setdefault(table, {})
             tab[query] = asdict(func(*args, **kwargs))
 
             if tab is not doc.last_item():
@@ -74,6 +84,39 @@ def rename(func: TCallable, key: str) -> TCallable:
     return wrapper  # type: ignore
 
 
+def read_toml(toml: PathLike) -> Mapping[str, Any]:
+    """Read a TOML file as a read-only mapping (cached by modification time)."""
+    stat = (toml := Path(toml)).stat()
+    key = stat.st_mtime_ns, stat.st_size
+
+    if (cached := TOML_DOCS.get(toml)) is not None and cached[:2] == key:
+        return cached[2]
+
+    doc = freeze(parse_toml(toml)) if stat.st_size else MappingProxyType({})
+    TOML_DOCS[toml] = *key, doc
+    return doc
+
+
+def parse_toml(toml: Path) -> dict[str, Any]:
+    """Parse a TOML file into a dictionary."""
+    with open(toml, "rb") as file:
+        if version_info >= (3, 11):
+            return fastload(file)
+        else:
+            return load(file).unwrap()
+
+
+def freeze(obj: Any) -> Any:
+    """Convert dictionaries and lists to read-only mappings and tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: freeze(val) for key, val in obj.items()})
+
+    if isinstance(obj, list):
+        return tuple(freeze(val) for val in obj)
+
+    return obj
+
+
 @contextmanager
 def sync_toml(toml: PathLike) -> Iterator[TOMLDocument]:
     """Open a TOML file as an updatable tomlkit document."""
@@ -82,3 +125,6 @@ def sync_toml(toml: PathLike) -> Iterator[TOMLDocument]:
 
     with open(toml, "w") as file:
         dump(doc, file)
+
+    # do not rely on mtime only (it may not change within a timestamp tick)
+    TOML_DOCS.pop(Path(toml), None)
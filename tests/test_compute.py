@@ -4,8 +4,19 @@ from io import StringIO
 
 # dependencies
 import pandas as pd
-from azely.azel import compute
-from pandas.testing import assert_frame_equal
+from azely.azel import (
+    SOLAR_TO_SIDEREAL,
+    AzEl,
+    _compute,
+    _compute_many,
+    compute,
+    compute_many,
+)
+from azely.location import Location
+from azely.object import Object
+from azely.time import Time
+from pandas.testing import assert_frame_equal, assert_index_equal
+from pytest import mark
 
 
 # constants
@@ -37,6 +48,16 @@ Asia/Tokyo,az,el,lst
 2020-02-01 23:00:00+09:00,106.59215723190304,-34.04536962878047,0 days 18:13:59.306768400
 2020-02-02 00:00:00+09:00,99.08617418966456,-20.549911723352988,0 days 19:14:09.163215600
 """
+site = Location("ALMA AOS", "-67.755", "-23.029", "5050 m")
+ngc1068 = Object("NGC1068", "02h42m40.771s", "-00d00m47.84s", "icrs")
+objects = [
+    Object("Sun", "NA", "NA", "solar"),
+    ngc1068,
+    Object("M87", "12h30m49.423s", "12d23m28.04s", "icrs"),
+    Object("Sgr A*", "17h45m40.04s", "-29d00m28.2s", "fk5"),
+    Object("Moon", "NA", "NA", "solar"),
+    Object("GC", "0deg", "0deg", "galactic"),
+]
 
 
 # test functions
@@ -47,3 +68,62 @@ def test_compute():
 
     columns = ["az", "el"]
     assert_frame_equal(result[columns], expected[columns], atol=1e-3)
+
+
+def test_compute_many():
+    objects = ["Sun", "NGC1068!", "M87"]
+    results = compute_many(objects, "ALMA AOS!", "2020-02-01", view="Tokyo", freq="1H")
+    assert list(results) == objects
+
+    for object in objects:
+        expected = compute(object, "ALMA AOS!", "2020-02-01", view="Tokyo", freq="1H")
+        assert_frame_equal(results[object], expected)
+
+
+def test_compute_many_offline() -> None:
+    time = Time(pd.date_range("2020-02-01", "2020-02-02", freq="1H", tz="UTC"))
+    results = _compute_many(objects, site, time)
+    assert len(results) == len(objects)
+
+    for object, result in zip(objects, results):
+        assert_frame_equal(result, _compute(object, site, time))
+        assert result.object == object
+        assert result.site == site
+
+
+@mark.parametrize("freq, atol", [("1T", 1e-6), ("10T", 0.0)])
+def test_compute_interp(freq, atol) -> None:
+    index = pd.date_range("2020-02-01", "2020-02-02", freq=freq, tz="UTC")
+    time = Time(index.as_unit("s"))
+
+    # interpolated only if samples are denser than interp (atol of 1e-6 deg ~ 4 mas)
+    result = _compute(ngc1068, site, time, interp=300)
+    expected = _compute(ngc1068, site, time, interp=0)
+    assert_frame_equal(result, expected, check_exact=not atol, atol=atol, rtol=0)
+
+
+@mark.parametrize("freq, unit", [(None, "ns"), ("1H", "ns"), (None, "s")])
+def test_in_lst(freq, unit) -> None:
+    df = pd.read_csv(StringIO(data), index_col=0)
+    df.index = pd.DatetimeIndex(df.index, freq=freq).as_unit(unit)
+    df.lst = pd.to_timedelta(df.lst)
+
+    # LST index by the original TimedeltaIndex-based formula
+    td = pd.DatetimeIndex(df.index, freq=None).as_unit("ns") - df.index[0]
+    td_lst = td * SOLAR_TO_SIDEREAL + df.lst.iloc[0]
+    td_lst = td_lst.floor("1D") + df.lst.to_numpy()
+    expected = pd.DatetimeIndex(pd.Timestamp(0) + td_lst, name="LST")
+
+    result = AzEl(df).in_lst
+    assert_index_equal(result.index, expected)
+    assert_frame_equal(result.reset_index(drop=True), df.reset_index(drop=True))
+
+
+def test_in_utc():
+    df = pd.read_csv(StringIO(data), index_col=0)
+    df.index = pd.to_datetime(df.index)
+
+    result = AzEl(df).in_utc
+    assert result.index.name == "UTC"
+    assert str(result.index.tz) == "UTC"
+    assert (result.index == df.index).all()
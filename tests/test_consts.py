@@ -0,0 +1,27 @@
+# standard library
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+
+# dependencies
+from azely.consts import getval
+
+
+# test functions
+def test_getval_empty() -> None:
+    with TemporaryDirectory() as dir:
+        (toml := Path(dir) / "config.toml").touch()
+
+        assert getval(toml, "defaults.freq", "10T") == "10T"
+        assert getval(toml, "defaults.view", str) is None
+
+
+def test_getval_values() -> None:
+    with TemporaryDirectory() as dir:
+        (toml := Path(dir) / "config.toml").write_text(
+            '[defaults]\nfreq = "1H"\ntimeout = 5\n'
+        )
+
+        assert getval(toml, "defaults.freq", "10T") == "1H"
+        assert getval(toml, "defaults.timeout", 10.0) == 5.0
+        assert getval(toml, "defaults.site", "here") == "here"
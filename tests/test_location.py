@@ -6,6 +6,7 @@ from tempfile import NamedTemporaryFile
 # dependencies
 from azely.location import Location, get_location
 from pytest import mark
+from timezonefinder import TimezoneFinder
 from tomlkit import dump
 
 
@@ -32,6 +33,9 @@ locations = [
 ]
 
 
+timezones = ["America/Santiago", "America/Mexico_City", "Asia/Tokyo"]
+
+
 # test functions
 @mark.parametrize("obj", locations)
 def test_get_location(obj: Location) -> None:
@@ -42,3 +46,13 @@ def test_get_location(obj: Location) -> None:
         assert get_location(obj.name, source=f.name) == obj
         # read the object from the TOML file
         assert get_location(obj.name, source=f.name) == obj
+
+
+@mark.parametrize("obj, tz", zip(locations, timezones))
+def test_location_timezone(obj: Location, tz: str) -> None:
+    assert str(obj.timezone) == tz
+
+
+def test_location_tf() -> None:
+    assert isinstance(Location.tf, TimezoneFinder)
+    assert Location.tf is locations[0].tf
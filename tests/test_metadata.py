@@ -6,3 +6,9 @@ import azely
 def test_version():
     """Make sure the version is valid."""
     assert azely.__version__ == "0.7.0"
+
+
+def test_dir():
+    """Make sure only public names are listed."""
+    names = [name for name in dir(azely) if not name.startswith("__")]
+    assert names == sorted(azely.__all__)
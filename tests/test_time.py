@@ -1,6 +1,9 @@
 # dependencies
 import pandas as pd
-from azely.time import get_time
+from astropy.coordinates import EarthLocation
+from astropy.time import Time as ObsTime
+from azely.time import Time, get_time
+from pytest import mark
 
 
 # constants
@@ -22,3 +25,14 @@ def test_time_by_tzinfo():
 def test_time_by_location():
     result = get_time("2020-01-01 to 2020-01-07", "Tokyo", "10T")
     assert (result == expected).all()
+
+
+@mark.parametrize("unit", ["ns", "s"])
+def test_time_to_obstime(unit):
+    # 2016-12-31 has a leap second at its end
+    index = pd.date_range("2016-12-31", "2017-01-01", None, "1T", tz="UTC")
+    result = Time(index.as_unit(unit)).to_obstime(EarthLocation.from_geodetic(0, 0))
+    expected = ObsTime(index.tz_convert(None))
+
+    assert (result.jd1 == expected.jd1).all()
+    assert (result.jd2 == expected.jd2).all()
@@ -0,0 +1,41 @@
+# standard library
+from os import utime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+
+# dependencies
+from azely.utils import TOML_DOCS, read_toml, sync_toml
+from pytest import raises
+
+
+# test functions
+def test_read_toml() -> None:
+    with TemporaryDirectory() as dir:
+        (toml := Path(dir) / "cache.toml").write_text('[object.a]\nname = "a"\n')
+        doc = read_toml(toml)
+
+        assert read_toml(toml) is doc
+        assert doc["object"]["a"]["name"] == "a"
+
+        with raises(TypeError):
+            doc["object"]["a"]["name"] = "b"  # type: ignore
+
+        toml.write_text('[object.bb]\nname = "bb"\n')
+
+        assert (doc := read_toml(toml))["object"]["bb"]["name"] == "bb"
+        assert TOML_DOCS[toml][2] is doc
+
+
+def test_sync_toml() -> None:
+    with TemporaryDirectory() as dir:
+        (toml := Path(dir) / "cache.toml").write_text('[object.a]\nname = "a"\n')
+        stat = toml.stat()
+        read_toml(toml)
+
+        with sync_toml(toml) as doc:
+            doc["object"]["a"]["name"] = "b"
+
+        # same size and (restored) mtime as before the update
+        utime(toml, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert read_toml(toml)["object"]["a"]["name"] == "b"